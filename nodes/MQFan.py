@@ -7,10 +7,29 @@ node MQFan
 """
 
 import udi_interface
-import json
+import re
+
+# orjson is optional, fall back to the stdlib decoder when it is not installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 LOGGER = udi_interface.LOGGER
 
+# fan speeds, matches the ST_FAN editor subset 0-3
+FAN_OFF = 0
+FAN_LOW = 1
+FAN_MEDIUM = 2
+FAN_HIGH = 3
+FAN_MAX = FAN_HIGH
+
+# command to report, indexed by [was running][now running]
+FAN_REPORT = ((None, "DON"), ("DOF", None))
+
+# Tasmota iFan payloads are tiny, pull FanSpeed out without a full decode
+FAN_SPEED_RE = re.compile(r'"FanSpeed"\s*:\s*(-?\d+)')
+
 class MQFan(udi_interface.Node):
     id = 'mqfan'
     
@@ -28,23 +47,30 @@ class MQFan(udi_interface.Node):
         """
         super().__init__(polyglot, primary, address, name)
         self.controller = self.poly.getNode(self.primary)
+        self._pub = self.controller.mqtt_pub
         self.cmd_topic = device["cmd_topic"]
-        self.fan_speed = 0
+        self.fan_speed = FAN_OFF
 
     def updateInfo(self, payload, topic: str):
-        fan_speed = 0
-        try:
-            json_payload = json.loads(payload)
-            fan_speed = int(json_payload['FanSpeed'])
-        except Exception as ex:
-            LOGGER.error(f"Could not decode payload {payload}: {ex}")
-        if 4 < fan_speed < 0:
+        fan_speed = FAN_OFF
+        match = FAN_SPEED_RE.search(payload)
+        if match:
+            fan_speed = int(match.group(1))
+        else:
+            try:
+                json_payload = json_loads(payload)
+                fan_speed = int(json_payload['FanSpeed'])
+            except Exception as ex:
+                LOGGER.error(f"Could not decode payload {payload}: {ex}")
+        self._apply_state(fan_speed)
+
+    def _apply_state(self, fan_speed):
+        if not FAN_OFF <= fan_speed <= FAN_MAX:
             LOGGER.error(f"Unexpected Fan Speed {fan_speed}")
             return
-        if self.fan_speed == 0 and fan_speed > 0:
-            self.reportCmd("DON")
-        if self.fan_speed > 0 and fan_speed == 0:
-            self.reportCmd("DOF")
+        report = FAN_REPORT[self.fan_speed > FAN_OFF][fan_speed > FAN_OFF]
+        if report:
+            self.reportCmd(report)
         self.fan_speed = fan_speed
         self.setDriver("ST", self.fan_speed)
 
@@ -53,23 +79,23 @@ class MQFan(udi_interface.Node):
             self.fan_speed = int(command.get('value'))
         except Exception as ex:
             LOGGER.info(f"Unexpected Fan Speed {ex}, assuming High")
-            self.fan_speed = 3
-        if 4 < self.fan_speed < 0:
+            self.fan_speed = FAN_HIGH
+        if not FAN_OFF <= self.fan_speed <= FAN_MAX:
             LOGGER.error(f"Unexpected Fan Speed {self.fan_speed}, assuming High")
-            self.fan_speed = 3
+            self.fan_speed = FAN_HIGH
         self.setDriver("ST", self.fan_speed)
-        self.controller.mqtt_pub(self.cmd_topic, self.fan_speed)
+        self._pub(self.cmd_topic, self.fan_speed)
 
     def set_off(self, command):
-        self.fan_speed = 0
+        self.fan_speed = FAN_OFF
         self.setDriver("ST", self.fan_speed)
-        self.controller.mqtt_pub(self.cmd_topic, self.fan_speed)
+        self._pub(self.cmd_topic, self.fan_speed)
 
     def speed_up(self, command):
-        self.controller.mqtt_pub(self.cmd_topic, "+")
+        self._pub(self.cmd_topic, "+")
 
     def speed_down(self, command):
-        self.controller.mqtt_pub(self.cmd_topic, "-")
+        self._pub(self.cmd_topic, "-")
 
     def query(self, command=None):
         """
@@ -77,7 +103,7 @@ class MQFan(udi_interface.Node):
         the parent class, so you don't need to override this method unless
         there is a need.
         """
-        self.controller.mqtt_pub(self.cmd_topic, "")
+        self._pub(self.cmd_topic, "")
         self.reportDrivers()
         
     # all the drivers - for reference
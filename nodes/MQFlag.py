@@ -29,6 +29,24 @@ import udi_interface
 
 LOGGER = udi_interface.LOGGER
 
+# payload -> ST value, see FLAG-n in the module docstring
+PAYLOAD_MAP = {
+    "OK": 0,
+    "NOK": 1,
+    "LO": 2,
+    "HI": 3,
+    "ERR": 4,
+    "IN": 5,
+    "OUT": 6,
+    "UP": 7,
+    "DOWN": 8,
+    "TRIGGER": 9,
+    "ON": 10,
+    "OFF": 11,
+    "---": 12,
+}
+ERROR_STATE = PAYLOAD_MAP["ERR"]
+
 class MQFlag(udi_interface.Node):
     id = 'mqflag'
     
@@ -49,34 +67,11 @@ class MQFlag(udi_interface.Node):
         self.cmd_topic = device["cmd_topic"]
 
     def updateInfo(self, payload, topic: str):
-        if payload == "OK":
-            self.setDriver("ST", 0)
-        elif payload == "NOK":
-            self.setDriver("ST", 1)
-        elif payload == "LO":
-            self.setDriver("ST", 2)
-        elif payload == "HI":
-            self.setDriver("ST", 3)
-        elif payload == "IN":
-            self.setDriver("ST", 5)
-        elif payload == "OUT":
-            self.setDriver("ST", 6)
-        elif payload == "UP":
-            self.setDriver("ST", 7)
-        elif payload == "DOWN":
-            self.setDriver("ST", 8)
-        elif payload == "TRIGGER":
-            self.setDriver("ST", 9)
-        elif payload == "ON":
-            self.setDriver("ST", 10)
-        elif payload == "OFF":
-            self.setDriver("ST", 11)
-        elif payload == "---":
-            self.setDriver("ST", 12)
-        else:
+        state = PAYLOAD_MAP.get(payload)
+        if state is None:
             LOGGER.error("Invalid payload {}".format(payload))
-            payload = "ERR"
-            self.setDriver("ST", 4)
+            state = ERROR_STATE
+        self.setDriver("ST", state)
 
     def reset_send(self, command):
         self.controller.mqtt_pub(self.cmd_topic, "RESET")
@@ -14,6 +14,10 @@ import json
 
 LOGGER = udi_interface.LOGGER
 
+# fixed on/off commands, encoded once
+LED_ON = json.dumps({"state": "ON"})
+LED_OFF = json.dumps({"state": "OFF"})
+
 class MQRGBWstrip(udi_interface.Node):
     id = 'mqrgbw'
     
@@ -66,10 +70,10 @@ class MQRGBWstrip(udi_interface.Node):
                 self.setDriver("GV6", data["pgm"])
 
     def led_on(self, command):
-        self.controller.mqtt_pub(self.cmd_topic, json.dumps({"state": "ON"}))
+        self.controller.mqtt_pub(self.cmd_topic, LED_ON)
 
     def led_off(self, command):
-        self.controller.mqtt_pub(self.cmd_topic, json.dumps({"state": "OFF"}))
+        self.controller.mqtt_pub(self.cmd_topic, LED_OFF)
 
     def rgbw_set(self, command):
         query = command.get("query")
@@ -11,6 +11,10 @@ import json
 
 LOGGER = udi_interface.LOGGER
 
+# fixed on/off commands, encoded once
+LED_ON = json.dumps({"state": "ON"})
+LED_OFF = json.dumps({"state": "OFF"})
+
 class MQSensor(udi_interface.Node):
     id = 'mqsens'
     
@@ -84,10 +88,10 @@ class MQSensor(udi_interface.Node):
                     self.setDriver("GV4", data["color"]["b"])
 
     def led_on(self, command):
-        self.controller.mqtt_pub(self.cmd_topic, json.dumps({"state": "ON"}))
+        self.controller.mqtt_pub(self.cmd_topic, LED_ON)
 
     def led_off(self, command):
-        self.controller.mqtt_pub(self.cmd_topic, json.dumps({"state": "OFF"}))
+        self.controller.mqtt_pub(self.cmd_topic, LED_OFF)
 
     def led_set(self, command):
         query = command.get("query")
@@ -14,6 +14,14 @@ import udi_interface
 
 LOGGER = udi_interface.LOGGER
 
+# status topic suffix -> driver it updates
+TOPIC_MAP = {
+    "temperature": "CLITEMP",
+    "flood": "GV0",
+    "battery": "BATLVL",
+    "error": "GPV",
+}
+
 class MQShellyFlood(udi_interface.Node):
     id = 'mqshflood'
     
@@ -37,17 +45,13 @@ class MQShellyFlood(udi_interface.Node):
         LOGGER.debug(f"Attempting to handle message for Shelly on topic {topic} with payload {payload}")
         topic_suffix = topic.split('/')[-1]
         self.setDriver("ST", 1)
-        if topic_suffix == "temperature":
-            self.setDriver("CLITEMP", payload)
+        driver = TOPIC_MAP.get(topic_suffix)
+        if driver is None:
+            LOGGER.warn(f"Unable to handle data for topic {topic}")
         elif topic_suffix == "flood":
-            value = payload == "true"
-            self.setDriver("GV0", value)
-        elif topic_suffix == "battery":
-            self.setDriver("BATLVL", payload)
-        elif topic_suffix == "error":
-            self.setDriver("GPV", payload)
+            self.setDriver(driver, payload == "true")
         else:
-            LOGGER.warn(f"Unable to handle data for topic {topic}")
+            self.setDriver(driver, payload)
 
     def query(self, command=None):
         """
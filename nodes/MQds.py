@@ -11,9 +11,14 @@ was made for DS18B20 waterproof
 
 import udi_interface
 import json
+import sys
 
 LOGGER = udi_interface.LOGGER
 
+# interned so sensor ids taken from the devfile can be compared by identity
+DEFAULT_SENSOR_ID = sys.intern('SINGLE_SENSOR')
+FALLBACK_SENSOR_ID = sys.intern('DS18B20')
+
 class MQds(udi_interface.Node):
     id = 'mqds'
 
@@ -33,32 +38,42 @@ class MQds(udi_interface.Node):
         self.controller = self.poly.getNode(self.primary)
         LOGGER.debug(f'DEVCLASS: {device} ')
         self.cmd_topic = device["cmd_topic"]
-        if 'sensor_id' in device:
-            self.sensor_id = device['sensor_id']
+        self.sensor_id = sys.intern(device.setdefault('sensor_id', DEFAULT_SENSOR_ID))
+        if self.sensor_id is not FALLBACK_SENSOR_ID:
+            self._lookup_keys = (self.sensor_id, FALLBACK_SENSOR_ID)
         else:
-            self.sensor_id = 'SINGLE_SENSOR'
-            device['sensor_id'] = self.sensor_id
+            self._lookup_keys = (FALLBACK_SENSOR_ID,)
         LOGGER.debug(f'CMD_ID {self.sensor_id}, {self.cmd_topic}')
         self.on = False
 
+    @property
+    def cmd_topic(self):
+        return self._cmd_topic
+
+    @cmd_topic.setter
+    def cmd_topic(self, topic):
+        # keep the Tasmota Status topic used by query in step with cmd_topic
+        self._cmd_topic = topic
+        self._status_topic = topic.rsplit('/', 1)[0] + '/Status'
+
     def start(self):
         pass
 
     def updateInfo(self, payload, topic: str):
+        # payload may already be decoded (dict), otherwise it is the raw JSON
         try:
-            data = json.loads(payload)
+            data = payload if isinstance(payload, dict) else json.loads(payload)
         except Exception as ex:
             LOGGER.error("Failed to parse MQTT Payload as Json: {} {}".format(ex, payload))
             return False
         LOGGER.debug(f'YYY {self.sensor_id}, {data} ')
         if 'StatusSNS' in data:
             data = data['StatusSNS']
-        if self.sensor_id in data:
-            self.setDriver("ST", 1)
-            self.setDriver("CLITEMP", data[self.sensor_id]["Temperature"])
-        elif 'DS18B20' in data:
-            self.setDriver("ST", 1)
-            self.setDriver("CLITEMP", data['DS18B20']["Temperature"])
+        for key in self._lookup_keys:
+            if key in data:
+                self.setDriver("ST", 1)
+                self.setDriver("CLITEMP", data[key]["Temperature"])
+                break
         else:
             self.setDriver("ST", 0)
             self.setDriver("GPV", 0)
@@ -70,9 +85,8 @@ class MQds(udi_interface.Node):
         there is a need.
         """
         LOGGER.debug(f'QUERY: {self.sensor_id}')
-        query_topic = self.cmd_topic.rsplit('/', 1)[0] + '/Status'
-        LOGGER.debug(f'QT: {query_topic}')
-        self.controller.mqtt_pub(query_topic, " 10")
+        LOGGER.debug(f'QT: {self._status_topic}')
+        self.controller.mqtt_pub(self._status_topic, " 10")
         self.reportDrivers()
         
     # all the drivers - for reference
@@ -40,6 +40,9 @@ class MQhcsr(udi_interface.Node):
                 "Failed to parse MQTT Payload as Json: {} {}".format(ex, payload)
             )
             return False
+        self._apply_data(data)
+
+    def _apply_data(self, data):
         if "SR04" in data:
             self.setDriver("ST", 1)
             self.setDriver("DISTANC", data["SR04"]["Distance"])
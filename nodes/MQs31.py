@@ -9,10 +9,27 @@ node MQs31
 """
 
 import udi_interface
-import json
+
+# orjson is optional, fall back to the stdlib decoder when it is not installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 LOGGER = udi_interface.LOGGER
 
+# Tasmota key holding the S31 power telemetry
+SENSOR_KEY = "ENERGY"
+
+# (driver, ENERGY field) pairs in the order they are reported
+ENERGY_DRIVERS = (
+    ("CC", "Current"),
+    ("CPW", "Power"),
+    ("CV", "Voltage"),
+    ("PF", "Factor"),
+    ("TPW", "Total"),
+)
+
 class MQs31(udi_interface.Node):
     id = 'mqs31'
     
@@ -32,22 +49,23 @@ class MQs31(udi_interface.Node):
         self.on = False
 
     def updateInfo(self, payload, topic: str):
+        # frames without an ENERGY block can't carry telemetry, skip the decode
+        if SENSOR_KEY not in payload:
+            self.setDriver("ST", 0)
+            return
         try:
-            data = json.loads(payload)
+            data = json_loads(payload)
         except Exception as ex:
             LOGGER.error(
                 "Failed to parse MQTT Payload as Json: {} {}".format(ex, payload)
             )
             return False
-        if "ENERGY" in data:
-            self.setDriver("ST", 1)
-            self.setDriver("CC", data["ENERGY"]["Current"])
-            self.setDriver("CPW", data["ENERGY"]["Power"])
-            self.setDriver("CV", data["ENERGY"]["Voltage"])
-            self.setDriver("PF", data["ENERGY"]["Factor"])
-            self.setDriver("TPW", data["ENERGY"]["Total"])
-        else:
-            self.setDriver("ST", 0)
+        energy = data.get(SENSOR_KEY) if isinstance(data, dict) else None
+        online = isinstance(energy, dict)
+        self.setDriver("ST", int(online))
+        if online:
+            for driver, field in ENERGY_DRIVERS:
+                self.setDriver(driver, energy[field])
 
     def query(self, command=None):
         """